@@ -22,7 +22,7 @@ check_root() {
 
 install_dependencies() {
     log_message "Installing Python dependencies..."
-    "$VENV_DIR/bin/pip" install psutil distro || { log_message "Failed to install Python dependencies."; exit 1; }
+    "$VENV_DIR/bin/pip" install psutil distro orjson || { log_message "Failed to install Python dependencies."; exit 1; }
     log_message "Python dependencies installed."
 }
 
@@ -1,61 +1,153 @@
 import socket
+import asyncio
+import functools
 import time
 import os
+import sys
+import mmap
+import array
+import struct
 import psutil
 import platform
 import hashlib # For basic password hashing
-import json
+import hmac # For constant-time password comparison
+import orjson
 import threading
+import queue
+import atexit
 import subprocess # For running external commands
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 
 # --- Configuration ---
 HOST = '0.0.0.0'  # Listen on all available interfaces
 PORT = 65432
 # IMPORTANT: Change this password in a real deployment!
-PASSWORD_HASH = hashlib.sha256("your_secret_password".encode()).hexdigest() # Store hash, not plain text
+PASSWORD_HASH = hashlib.sha256(b"your_secret_password").digest() # Store hash (raw digest), not plain text
 LOG_FILE = "daemon_log.txt"
-UPTIME_TRACKING_FILE = "uptime_data.json" # To store boot times for percentage calculation
+UPTIME_TRACKING_FILE = "uptime_data.bin" # Append-only boot times (little-endian float64 each) for percentage calculation
+SYSTEM_INFO_CACHE_TTL = 1.0 # Seconds a serialized 'get_system_info' response is reused
+CPU_SAMPLE_INTERVAL = 1.0 # Seconds between background CPU usage samples
+MAX_CLIENT_WORKERS = min(32, (os.cpu_count() or 4) * 4) # Threads for blocking work (psutil, reboot, updater)
+CLIENT_TIMEOUT = 60 # Seconds to wait for a client to send its password or command
+LISTEN_BACKLOG = 128 # Pending connections queued by the kernel before accept
+LOG_BATCH_SIZE = 64 # Max error log lines written per batch
+LOG_FLUSH_INTERVAL = 0.1 # Seconds the log writer gathers lines before writing a batch
+
+# --- Constants ---
+_GIB = 1 / (1024**3) # Multiply bytes by this to get GiB
+_IS_LINUX = platform.system() == "Linux"
+_BOOT_RECORD = struct.Struct('<d') # One boot timestamp in UPTIME_TRACKING_FILE
+_BOOT_TIME = psutil.boot_time() # Fixed for the life of the process
+
+# --- Shared State ---
+_cpu_usage_percent = 0.0 # Latest sample from the CPU sampler thread
+_system_info_cache = {"ts": float("-inf"), "payload": None} # Serialized 'get_system_info' response
+_system_info_lock = threading.Lock()
+_log_queue = queue.Queue() # Error log lines waiting for the log writer thread
+_log_writer_thread = None
+_log_writer_lock = threading.Lock()
 
 # --- Helper Functions ---
 
+def _ts():
+    """Returns the current local time formatted for console and log lines."""
+    return time.strftime("%Y-%m-%d %H:%M:%S")
+
 def log_message(message, is_error=False):
     """
     Logs a message to the log file (only if is_error is True) and prints to console.
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    full_message = f"[{timestamp}] {message}"
+    full_message = f"[{_ts()}] {message}"
     print(full_message) # Always print to console
 
     if is_error:
-        with open(LOG_FILE, "a") as f:
-            f.write(full_message + "\n")
+        start_log_writer()
+        _log_queue.put(full_message + "\n")
+
+def log_writer():
+    """Drains the log queue into LOG_FILE, keeping the file open for the daemon's lifetime.
+
+    Lines are gathered for up to LOG_FLUSH_INTERVAL seconds or LOG_BATCH_SIZE lines,
+    then written and fsync'd as one batch.
+    """
+    with open(LOG_FILE, "a") as f:
+        while True:
+            messages = [_log_queue.get()]
+            deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+            while len(messages) < LOG_BATCH_SIZE and messages[-1] is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    messages.append(_log_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            stop = messages[-1] is None # Sentinel queued by stop_log_writer()
+            f.write("".join(m for m in messages if m is not None))
+            f.flush()
+            os.fsync(f.fileno())
+            if stop:
+                return
+
+def start_log_writer():
+    """Starts the log writer thread if it is not running in this process (threads do not survive fork)."""
+    global _log_writer_thread
+    if _log_writer_thread is not None and _log_writer_thread.is_alive():
+        return
+    with _log_writer_lock:
+        if _log_writer_thread is None or not _log_writer_thread.is_alive():
+            _log_writer_thread = threading.Thread(target=log_writer, name="log-writer")
+            _log_writer_thread.daemon = True
+            _log_writer_thread.start()
+
+@atexit.register
+def stop_log_writer():
+    """Flushes any queued log lines before the interpreter exits."""
+    if _log_writer_thread is not None and _log_writer_thread.is_alive():
+        _log_queue.put(None)
+        _log_writer_thread.join(timeout=5)
 
 def get_uptime_seconds():
     """Gets system uptime in seconds."""
-    return time.time() - psutil.boot_time()
+    return time.time() - _BOOT_TIME
 
 def load_boot_times():
-    """Loads historical boot times from a file."""
-    if os.path.exists(UPTIME_TRACKING_FILE):
-        try:
-            with open(UPTIME_TRACKING_FILE, "r") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            log_message(f"Error decoding JSON from {UPTIME_TRACKING_FILE}. Returning empty list.", is_error=True)
-            return []
-    return []
+    """Loads historical boot times from the append-only tracking file."""
+    boot_times = array.array('d')
+    try:
+        with open(UPTIME_TRACKING_FILE, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            size -= size % _BOOT_RECORD.size # Ignore a partially written trailing record
+            if size == 0:
+                return boot_times
+            with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                boot_times.frombytes(mm)
+    except FileNotFoundError:
+        return boot_times
+    except (OSError, ValueError) as e:
+        log_message(f"Error reading boot times from {UPTIME_TRACKING_FILE}: {e}. Returning empty list.", is_error=True)
+        return array.array('d')
+    if sys.byteorder == "big": # Records are stored little-endian
+        boot_times.byteswap()
+    return boot_times
 
 def save_boot_time():
-    """Saves the current boot time."""
-    boot_times = load_boot_times()
-    current_boot_time_ts = psutil.boot_time()
-    # Avoid duplicate entries if daemon restarts without reboot
-    if not any(abs(bt - current_boot_time_ts) < 60 for bt in boot_times): # Check if already logged within a minute
-        boot_times.append(current_boot_time_ts)
+    """Appends the current boot time unless it is already the latest record."""
+    current_boot_time_ts = _BOOT_TIME
     try:
-        with open(UPTIME_TRACKING_FILE, "w") as f:
-            json.dump(boot_times, f)
+        with open(UPTIME_TRACKING_FILE, "a+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size % _BOOT_RECORD.size: # Drop a partially written trailing record to stay aligned
+                size -= size % _BOOT_RECORD.size
+                f.truncate(size)
+            if size:
+                f.seek(size - _BOOT_RECORD.size)
+                (last_boot_time_ts,) = _BOOT_RECORD.unpack(f.read(_BOOT_RECORD.size))
+                # Avoid duplicate entries if daemon restarts without reboot
+                if abs(last_boot_time_ts - current_boot_time_ts) < 60: # Check if already logged within a minute
+                    return
+            f.write(_BOOT_RECORD.pack(current_boot_time_ts)) # Append mode: always lands at the end
     except IOError as e:
         log_message(f"Error saving boot time to {UPTIME_TRACKING_FILE}: {e}", is_error=True)
 
@@ -64,7 +156,7 @@ def get_uptime_percentage_last_7_days():
     """Calculates uptime percentage for the last 7 days."""
     now = time.time()
     seven_days_ago = now - timedelta(days=7).total_seconds()
-    current_boot_time = psutil.boot_time()
+    current_boot_time = _BOOT_TIME
 
     total_time_in_period = timedelta(days=7).total_seconds()
 
@@ -84,195 +176,253 @@ def get_uptime_percentage_last_7_days():
     return (uptime_this_session_in_window / total_time_in_period) * 100 if total_time_in_period > 0 else 0
 
 
-def get_system_info_data():
-    """Gathers all required system information. Returns a dict."""
-    uptime_sec = get_uptime_seconds()
-    uptime_hours = uptime_sec // 3600
-    uptime_minutes = (uptime_sec % 3600) // 60
-
-    info = {
-        "uptime_string": f"{int(uptime_hours)}h {int(uptime_minutes)}m",
-        "uptime_seconds_current_session": int(uptime_sec),
-        "uptime_percentage_last_7_days": f"{get_uptime_percentage_last_7_days():.2f}%",
-        "ram_usage": {
-            "total_gb": f"{psutil.virtual_memory().total / (1024**3):.2f}",
-            "available_gb": f"{psutil.virtual_memory().available / (1024**3):.2f}",
-            "percent_used": f"{psutil.virtual_memory().percent:.2f}%"
-        },
-        "cpu_usage_percent": f"{psutil.cpu_percent(interval=0.5):.2f}%", # Reduced interval slightly
-        "disk_usage_root": {
-            "total_gb": f"{psutil.disk_usage('/').total / (1024**3):.2f}",
-            "used_gb": f"{psutil.disk_usage('/').used / (1024**3):.2f}",
-            "free_gb": f"{psutil.disk_usage('/').free / (1024**3):.2f}",
-            "percent_used": f"{psutil.disk_usage('/').percent:.2f}%"
-        },
-        "kernel_version": platform.release() if platform.system() == "Linux" else "N/A",
-        "distro_name": "N/A",
-        "platform_system": platform.system(),
-        "platform_node": platform.node(),
-    }
-    if platform.system() == "Linux":
+def _resolve_distro():
+    """Resolves the distro name. Called once at import; the result never changes."""
+    distro_name = "N/A"
+    if _IS_LINUX:
         try:
             import distro
-            info["distro_name"] = distro.name(pretty=True)
+            distro_name = distro.name(pretty=True)
         except ImportError:
             try:
                 # Fallback for older systems or if 'distro' is not installed
                 # platform.linux_distribution() was removed in Python 3.8
                 if hasattr(platform, 'linux_distribution'):
-                    info["distro_name"] = " ".join(platform.linux_distribution()).strip()
-                if not info["distro_name"] or info["distro_name"].lower() == "n/a": # Further fallback
+                    distro_name = " ".join(platform.linux_distribution()).strip()
+                if not distro_name or distro_name.lower() == "n/a": # Further fallback
                     with open("/etc/os-release") as f:
                         for line in f:
                             if line.startswith("PRETTY_NAME="):
-                                info["distro_name"] = line.split("=", 1)[1].strip().strip('"')
+                                distro_name = line.split("=", 1)[1].strip().strip('"')
                                 break
             except FileNotFoundError:
-                info["distro_name"] = "Linux (Unknown Distro - /etc/os-release not found)"
+                distro_name = "Linux (Unknown Distro - /etc/os-release not found)"
             except Exception as e:
                 log_message(f"Linux (Error fetching distro: {e})", is_error=True)
-                info["distro_name"] = f"Linux (Error fetching distro: {e})"
+                distro_name = f"Linux (Error fetching distro: {e})"
         except Exception as e:
              log_message(f"Linux (Distro lookup error: {e})", is_error=True)
-             info["distro_name"] = f"Linux (Distro lookup error: {e})"
+             distro_name = f"Linux (Distro lookup error: {e})"
+    return distro_name
+
+# Invariant for the daemon's lifetime, so resolved once instead of per request
+_KERNEL = platform.release() if _IS_LINUX else "N/A"
+_DISTRO = _resolve_distro()
+_STATIC_SYSTEM_INFO = {
+    "kernel_version": _KERNEL,
+    "distro_name": _DISTRO,
+    "platform_system": platform.system(),
+    "platform_node": platform.node(),
+}
+# '{"status":"success","data":{<static fields>' -- get_system_info_payload() splices the volatile fields on
+_SYSTEM_INFO_PREFIX = orjson.dumps({"status": "success", "data": _STATIC_SYSTEM_INFO})[:-2]
+
+def cpu_sampler():
+    """Samples CPU usage in the background so requests never block on it."""
+    global _cpu_usage_percent
+    while True:
+        _cpu_usage_percent = psutil.cpu_percent(interval=CPU_SAMPLE_INTERVAL)
+
+def start_cpu_sampler():
+    """Starts the background CPU sampler thread."""
+    sampler_thread = threading.Thread(target=cpu_sampler, name="cpu-sampler")
+    sampler_thread.daemon = True
+    sampler_thread.start()
+
+def get_system_info_data():
+    """Gathers the system information that changes between requests. Returns a dict.
+
+    The invariant fields live in _STATIC_SYSTEM_INFO.
+
+    Sizes are GiB and usage values are percentages, both as plain numbers;
+    formatting (e.g. a trailing '%') is left to the client.
+    """
+    uptime_sec = int(get_uptime_seconds())
+    uptime_hours, uptime_rem = divmod(uptime_sec, 3600)
+    uptime_minutes = uptime_rem // 60
+
+    vm = psutil.virtual_memory()
+    du = psutil.disk_usage('/')
+
+    info = {
+        "uptime_string": f"{uptime_hours}h {uptime_minutes}m",
+        "uptime_seconds_current_session": uptime_sec,
+        "uptime_percentage_last_7_days": round(get_uptime_percentage_last_7_days(), 2),
+        "ram_usage": {
+            "total_gb": round(vm.total * _GIB, 2),
+            "available_gb": round(vm.available * _GIB, 2),
+            "percent_used": vm.percent
+        },
+        "cpu_usage_percent": _cpu_usage_percent, # Sampled by cpu_sampler()
+        "disk_usage_root": {
+            "total_gb": round(du.total * _GIB, 2),
+            "used_gb": round(du.used * _GIB, 2),
+            "free_gb": round(du.free * _GIB, 2),
+            "percent_used": du.percent
+        },
+    }
     return info
 
-def send_response(conn, data):
-    """Sends a JSON response to the client."""
+def get_system_info_payload():
+    """Returns the serialized 'get_system_info' response, rebuilt at most once per SYSTEM_INFO_CACHE_TTL."""
+    if time.monotonic() - _system_info_cache["ts"] < SYSTEM_INFO_CACHE_TTL:
+        return _system_info_cache["payload"]
+    with _system_info_lock:
+        # Another thread may have refreshed the cache while we waited for the lock
+        if time.monotonic() - _system_info_cache["ts"] >= SYSTEM_INFO_CACHE_TTL:
+            volatile_bytes = orjson.dumps(get_system_info_data())
+            _system_info_cache["payload"] = _SYSTEM_INFO_PREFIX + b"," + volatile_bytes[1:] + b"}"
+            _system_info_cache["ts"] = time.monotonic()
+        return _system_info_cache["payload"]
+
+async def send_response(writer, data):
+    """Sends a JSON response to the client. Already serialized bytes are sent as-is."""
     try:
-        response_json = json.dumps(data)
-        conn.sendall(response_json.encode('utf-8'))
+        writer.write(data if isinstance(data, bytes) else orjson.dumps(data))
+        await writer.drain()
     except Exception as e:
         log_message(f"Error sending response: {e}", is_error=True)
 
 # --- Remotely Callable Functions ---
-def handle_get_system_info(conn):
+async def handle_get_system_info(writer):
     """Handles the 'get_system_info' action."""
     # Only log errors, so no log_message for success
-    system_data = get_system_info_data()
-    send_response(conn, {"status": "success", "data": system_data})
+    loop = asyncio.get_running_loop()
+    payload = await loop.run_in_executor(None, get_system_info_payload) # psutil calls block
+    await send_response(writer, payload)
 
-def handle_reboot_system(conn, addr):
+async def handle_reboot_system(writer, addr):
     """Handles the 'reboot' action."""
     # SECURITY: Ensure the user running this script has sudo NOPASSWD for 'reboot'
     # or run this script as root (less recommended).
-    command = ["sudo", "reboot", "now"]
+    command = ["reboot", "now"]
+    if not (hasattr(os, "geteuid") and os.geteuid() == 0):
+        command.insert(0, "sudo") # Already root (e.g. the systemd unit): skip the sudo process
+    loop = asyncio.get_running_loop()
     try:
-        send_response(conn, {"status": "success", "message": "Reboot command issued. Server will shut down."})
+        await send_response(writer, {"status": "success", "message": "Reboot command issued. Server will shut down."})
         # Give a moment for the message to be sent before rebooting
-        time.sleep(1)
-        subprocess.run(command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        await asyncio.sleep(1)
+        await loop.run_in_executor(None, functools.partial(subprocess.run, command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE))
         # The script will likely terminate here if reboot is successful
     except FileNotFoundError:
-        log_message(f"Error: 'sudo' command not found. Cannot reboot.", is_error=True)
-        send_response(conn, {"status": "error", "message": "Reboot command 'sudo' not found on server."})
+        log_message(f"Error: '{command[0]}' command not found. Cannot reboot.", is_error=True)
+        await send_response(writer, {"status": "error", "message": f"Reboot command '{command[0]}' not found on server."})
     except subprocess.CalledProcessError as e:
         log_message(f"Error during reboot: {e.stderr.decode() if e.stderr else e}", is_error=True)
         # May not be able to send this if reboot has already started partially
         try:
-            send_response(conn, {"status": "error", "message": f"Reboot failed: {e.stderr.decode() if e.stderr else e}"})
+            await send_response(writer, {"status": "error", "message": f"Reboot failed: {e.stderr.decode() if e.stderr else e}"})
         except:
             pass # Connection might be dead
     except Exception as e:
         log_message(f"An unexpected error occurred during reboot: {e}", is_error=True)
         try:
-            send_response(conn, {"status": "error", "message": f"An unexpected error occurred during reboot: {e}"})
+            await send_response(writer, {"status": "error", "message": f"An unexpected error occurred during reboot: {e}"})
         except:
             pass
 
 
-def handle_update_system(conn, addr):
+async def handle_update_system(writer, addr):
     """Handles the 'update' action using UnifiedUpdater."""
     # Ensure UnifiedUpdater is in PATH or use its full path.
     # Example: command = ["/path/to/your/UnifiedUpdater"]
     command = ["UnifiedUpdater"] # Assuming it's in PATH
+    loop = asyncio.get_running_loop()
     try:
         # Using a timeout for the updater process can be a good idea
-        process = subprocess.run(command, capture_output=True, text=True, check=False, timeout=3600) # 1 hour timeout
+        process = await loop.run_in_executor(None, functools.partial(subprocess.run, command, capture_output=True, text=True, check=False, timeout=3600)) # 1 hour timeout
 
         stdout = process.stdout.strip()
         stderr = process.stderr.strip()
 
         if process.returncode == 0:
             # Success, no log_message to file, but still print to console
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] UnifiedUpdater completed successfully.")
-            send_response(conn, {"status": "success", "message": "Update process completed.", "output": stdout, "error": stderr if stderr else ""})
+            print(f"[{_ts()}] UnifiedUpdater completed successfully.")
+            await send_response(writer, {"status": "success", "message": "Update process completed.", "output": stdout, "error": stderr if stderr else ""})
         else:
             log_message(f"UnifiedUpdater failed. Return code: {process.returncode}\nStdout:\n{stdout}\nStderr:\n{stderr}", is_error=True)
-            send_response(conn, {"status": "error", "message": "Update process failed.", "output": stdout, "error": stderr, "return_code": process.returncode})
+            await send_response(writer, {"status": "error", "message": "Update process failed.", "output": stdout, "error": stderr, "return_code": process.returncode})
 
     except FileNotFoundError:
         log_message(f"Error: '{command[0]}' command not found. Cannot update.", is_error=True)
-        send_response(conn, {"status": "error", "message": f"Update command '{command[0]}' not found on server."})
+        await send_response(writer, {"status": "error", "message": f"Update command '{command[0]}' not found on server."})
     except subprocess.TimeoutExpired:
         log_message(f"Error: UnifiedUpdater command timed out.", is_error=True)
-        send_response(conn, {"status": "error", "message": "Update process timed out."})
+        await send_response(writer, {"status": "error", "message": "Update process timed out."})
     except subprocess.CalledProcessError as e: # Should be caught by check=False and returncode check, but as a fallback
         log_message(f"Error during update (CalledProcessError): {e.stderr if e.stderr else e}", is_error=True)
-        send_response(conn, {"status": "error", "message": f"Update failed: {e.stderr if e.stderr else e}"})
+        await send_response(writer, {"status": "error", "message": f"Update failed: {e.stderr if e.stderr else e}"})
     except Exception as e:
         log_message(f"An unexpected error occurred during update: {e}", is_error=True)
-        send_response(conn, {"status": "error", "message": f"An unexpected error occurred during update: {e}"})
+        await send_response(writer, {"status": "error", "message": f"An unexpected error occurred during update: {e}"})
 
 
 # --- Main Client Handler ---
-def handle_client(conn, addr):
+async def handle_client(reader, writer):
     """Handles a single client connection."""
+    addr = writer.get_extra_info("peername")
+    # asyncio already disables Nagle (TCP_NODELAY) on accepted TCP sockets; also detect dead peers
+    writer.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
     # Success, so no log_message to file, but still print to console
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Connected by {addr}")
+    print(f"[{_ts()}] Connected by {addr}")
     try:
         # 1. Authentication
-        conn.sendall(b"Password: ")
-        password_attempt_bytes = conn.recv(1024)
+        writer.write(b"Password: ")
+        await writer.drain()
+        # read() returns whatever has arrived, like socket.recv(), so clients need not send a newline
+        password_attempt_bytes = await asyncio.wait_for(reader.read(1024), CLIENT_TIMEOUT)
         if not password_attempt_bytes:
             log_message(f"Client {addr} disconnected before sending password.", is_error=True)
             return
-        password_attempt = password_attempt_bytes.strip().decode('utf-8')
 
-        if hashlib.sha256(password_attempt.encode('utf-8')).hexdigest() != PASSWORD_HASH:
-            conn.sendall(b"Authentication failed.\n")
+        if not hmac.compare_digest(hashlib.sha256(password_attempt_bytes.strip()).digest(), PASSWORD_HASH):
+            writer.write(b"Authentication failed.\n")
+            await writer.drain()
             log_message(f"Authentication failed for {addr}", is_error=True)
             return
 
-        conn.sendall(b"Authentication successful. Send JSON command.\n")
+        writer.write(b"Authentication successful. Send JSON command.\n")
+        await writer.drain()
         # Success, so no log_message to file, but still print to console
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Authentication successful for {addr}. Waiting for command.")
+        print(f"[{_ts()}] Authentication successful for {addr}. Waiting for command.")
 
         # 2. Receive Action Command
-        request_bytes = conn.recv(2048) # Increased buffer size for JSON
+        request_bytes = await asyncio.wait_for(reader.read(2048), CLIENT_TIMEOUT) # Increased buffer size for JSON
         if not request_bytes:
             log_message(f"Client {addr} disconnected before sending command.", is_error=True)
             return
 
-        request_str = request_bytes.decode('utf-8').strip()
+        # orjson accepts the surrounding whitespace, so the bytes are parsed as received without a stripped copy
+        request_str = request_bytes.decode('utf-8', errors='replace').strip() # For console/log output only
         # Success, so no log_message to file, but still print to console
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Received command string from {addr}: {request_str}")
+        print(f"[{_ts()}] Received command string from {addr}: {request_str}")
 
         try:
-            request_data = json.loads(request_str)
+            request_data = orjson.loads(request_bytes)
             action = request_data.get("action")
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             log_message(f"Invalid JSON received from {addr}: {request_str}", is_error=True)
-            send_response(conn, {"status": "error", "message": "Invalid JSON command."})
+            await send_response(writer, {"status": "error", "message": "Invalid JSON command."})
             return
         except Exception as e: # Catch any other error during parsing
             log_message(f"Error processing command from {addr}: {e}", is_error=True)
-            send_response(conn, {"status": "error", "message": f"Could not parse command: {e}"})
+            await send_response(writer, {"status": "error", "message": f"Could not parse command: {e}"})
             return
 
 
         # 3. Dispatch Action
         if action == "get_system_info":
-            handle_get_system_info(conn)
+            await handle_get_system_info(writer)
         elif action == "reboot":
-            handle_reboot_system(conn, addr)
+            await handle_reboot_system(writer, addr)
         elif action == "update":
-            handle_update_system(conn, addr)
+            await handle_update_system(writer, addr)
         else:
             log_message(f"Unknown action '{action}' requested by {addr}", is_error=True)
-            send_response(conn, {"status": "error", "message": f"Unknown action: {action}"})
+            await send_response(writer, {"status": "error", "message": f"Unknown action: {action}"})
 
-    except socket.timeout:
+    except asyncio.TimeoutError:
         log_message(f"Connection timed out for {addr}", is_error=True)
     except BrokenPipeError:
         log_message(f"Client {addr} disconnected abruptly (BrokenPipeError).", is_error=True)
@@ -282,42 +432,41 @@ def handle_client(conn, addr):
         log_message(f"Error handling client {addr}: {type(e).__name__} - {e}", is_error=True)
         # Attempt to send an error to the client if the connection is still somewhat alive
         try:
-            send_response(conn, {"status": "error", "message": "An unexpected server error occurred."})
+            await send_response(writer, {"status": "error", "message": "An unexpected server error occurred."})
         except Exception as send_e:
             log_message(f"Could not send final error to client {addr}: {send_e}", is_error=True)
     finally:
-        conn.close()
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass # Peer may already be gone
         # Success, so no log_message to file, but still print to console
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Connection closed with {addr}")
+        print(f"[{_ts()}] Connection closed with {addr}")
+
+async def serve():
+    """Accepts clients on a single event loop; blocking work runs on the default executor."""
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=MAX_CLIENT_WORKERS, thread_name_prefix="worker"))
+    server = await asyncio.start_server(handle_client, HOST, PORT, reuse_address=True, backlog=LISTEN_BACKLOG)
+    # Success, so no log_message to file, but still print to console
+    print(f"[{_ts()}] Daemon listening on {HOST}:{PORT}")
+    async with server:
+        await server.serve_forever()
 
 def daemon_main():
     """Main daemon loop."""
     save_boot_time() # Save current boot time when daemon starts or restarts
+    start_cpu_sampler()
 
-    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     try:
-        s.bind((HOST, PORT))
-        s.listen()
-        # Success, so no log_message to file, but still print to console
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Daemon listening on {HOST}:{PORT}")
-        while True:
-            try:
-                conn, addr = s.accept()
-                conn.settimeout(60) # Timeout for individual socket operations
-                client_thread = threading.Thread(target=handle_client, args=(conn, addr))
-                client_thread.daemon = True
-                client_thread.start()
-            except Exception as e: # Catch errors in the accept loop itself
-                log_message(f"Error accepting connection: {e}", is_error=True)
-                time.sleep(1) # Avoid fast spinning on persistent accept errors
+        asyncio.run(serve())
     except OSError as e:
         log_message(f"OSError: {e}. Could not bind to {HOST}:{PORT}. Port might be in use or permission denied.", is_error=True)
     except Exception as e:
         log_message(f"Critical daemon error in main loop: {e}", is_error=True)
     finally:
         log_message("Daemon shutting down.", is_error=True) # Log daemon shutdown to ensure it's recorded
-        s.close()
 
 # --- Daemonization (Basic) ---
 def become_daemon():
@@ -351,7 +500,7 @@ def become_daemon():
         os._exit(1)
 
     # Success, so no log_message to file, but still print to console
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Daemon process started.")
+    print(f"[{_ts()}] Daemon process started.")
 
     # Redirect standard file descriptors (optional but good practice for daemons)
     # sys.stdout.flush()
@@ -369,7 +518,7 @@ def become_daemon():
 if __name__ == "__main__":
     # For testing, you might want to run it directly without full daemonization:
     # Success, so no log_message to file, but still print to console
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting daemon (foreground mode for this example)...")
+    print(f"[{_ts()}] Starting daemon (foreground mode for this example)...")
     # To run as a daemon (on Linux/macOS):
     # become_daemon()
     daemon_main() # For direct execution